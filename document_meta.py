@@ -0,0 +1,46 @@
+from typing import Any, Dict, List, Tuple
+import os
+
+import msgpack
+from langchain_core.documents import Document
+
+
+def write_document_meta(folder_path: str, documents: List[Document], **fields: Any):
+    """
+    Writes documents (id, content, and metadata) in order to meta.msgpack,
+    so row i of a saved embedding matrix or index maps to entry i.
+
+    Args:
+        folder_path (str): Directory to write meta.msgpack to.
+        documents (List[Document]): Documents in index order.
+        **fields: Extra store-level values to save alongside the documents.
+    """
+    payload = dict(fields)
+    payload["documents"] = [
+        {"id": doc.id, "page_content": doc.page_content, "metadata": doc.metadata}
+        for doc in documents
+    ]
+    with open(os.path.join(folder_path, "meta.msgpack"), "wb") as f:
+        # Metadata values msgpack cannot encode (e.g. datetimes) are stored as str
+        f.write(msgpack.packb(payload, default=str))
+
+
+def read_document_meta(folder_path: str) -> Tuple[List[Document], Dict[str, Any]]:
+    """
+    Reads documents written by write_document_meta.
+
+    Args:
+        folder_path (str): Directory containing meta.msgpack.
+
+    Returns:
+        Tuple[List[Document], Dict[str, Any]]: Documents in index order and
+        the extra store-level fields.
+    """
+    with open(os.path.join(folder_path, "meta.msgpack"), "rb") as f:
+        payload = msgpack.unpackb(f.read())
+
+    documents = [
+        Document(id=entry["id"], page_content=entry["page_content"], metadata=entry["metadata"])
+        for entry in payload.pop("documents")
+    ]
+    return documents, payload
@@ -1,19 +1,136 @@
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+import asyncio
+import glob
+import hashlib
 import os
-import pickle
+import sqlite3
+import threading
+import uuid
+import warnings
+
+import aiohttp
+import httpx
+import numpy as np
 
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_ollama import OllamaEmbeddings
 from langchain_core.documents import Document
 from langchain_community.document_loaders import (
     PyPDFLoader,
-    DirectoryLoader,
     TextLoader,
     UnstructuredMarkdownLoader,
 )
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.vectorstores import VectorStore
 import faiss  # Facebook AI Similarity Search library
 
+from document_meta import read_document_meta, write_document_meta
+from flat_matrix_store import FlatMatrixStore
+
+# Number of chunks sent to the Ollama embeddings endpoint per request
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+
+# Number of embedding requests kept in flight against the Ollama server
+EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "4"))
+
+# Seconds an idle keep-alive connection to the Ollama server is kept open, so
+# query embeddings spaced out by user interaction reuse the same connection
+OLLAMA_KEEPALIVE_SECONDS = float(os.getenv("OLLAMA_KEEPALIVE_SECONDS", "300"))
+
+# Total characters below which documents are split inline; a process pool
+# only pays off once splitting outweighs worker startup and pickling
+PARALLEL_SPLIT_MIN_CHARS = int(os.getenv("PARALLEL_SPLIT_MIN_CHARS", "4000000"))
+
+# Knowledge bases up to this many chunks skip FAISS indexing entirely and are
+# searched brute-force over a single embedding matrix (see FlatMatrixStore)
+FLAT_MATRIX_MAX_CHUNKS = int(os.getenv("FLAT_MATRIX_MAX_CHUNKS", "10000"))
+
+# Knowledge bases with at least this many chunks use a compressed IVF-PQ index
+# instead of a flat one; nlist/m/nprobe trade recall against speed and memory
+IVF_MIN_CHUNKS = int(os.getenv("IVF_MIN_CHUNKS", "50000"))
+IVF_NLIST = int(os.getenv("IVF_NLIST", "256"))
+PQ_M = int(os.getenv("PQ_M", "32"))
+IVF_NPROBE = int(os.getenv("IVF_NPROBE", "16"))
+
+# Directory of the persistent content-hash -> vector embedding cache
+EMBED_CACHE_DIR = os.getenv("EMBED_CACHE_DIR", "embed_cache")
+
+# Max number of keys per SQL "IN (...)" lookup (SQLite variable limit)
+CACHE_LOOKUP_CHUNK = 500
+
+# Supported loaders by file extension
+LOADER_MAPPING = {
+    ".pdf": PyPDFLoader,
+    ".txt": TextLoader,
+    ".md": UnstructuredMarkdownLoader,
+}
+
+
+def load_single_document(file_path: str) -> List[Document]:
+    """
+    Loads a single file with the loader registered for its extension.
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        file_path (str): Path to a .pdf, .txt, or .md file.
+
+    Returns:
+        List[Document]: Documents produced by the loader.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    return LOADER_MAPPING[ext](file_path).load()
+
+
+class LiteralSeparatorTextSplitter(RecursiveCharacterTextSplitter):
+    """
+    RecursiveCharacterTextSplitter for plain-string separators. Separator
+    detection and splitting use str's C-level `in` and `split` instead of
+    building and running a regex at every level of the recursion.
+    """
+
+    def __init__(self, **kwargs):
+        # Literal separators that are dropped on split and re-inserted on merge
+        super().__init__(is_separator_regex=False, keep_separator=False, **kwargs)
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        final_chunks = []
+
+        # Use the first separator present in the text; recurse with the rest
+        separator = separators[-1]
+        new_separators = []
+        for i, candidate in enumerate(separators):
+            if candidate == "":
+                separator = candidate
+                break
+            if candidate in text:
+                separator = candidate
+                new_separators = separators[i + 1:]
+                break
+
+        pieces = text.split(separator) if separator else list(text)
+        splits = [piece for piece in pieces if piece != ""]
+
+        good_splits = []
+        for piece in splits:
+            if self._length_function(piece) < self._chunk_size:
+                good_splits.append(piece)
+            else:
+                if good_splits:
+                    final_chunks.extend(self._merge_splits(good_splits, separator))
+                    good_splits = []
+                if not new_separators:
+                    final_chunks.append(piece)
+                else:
+                    final_chunks.extend(self._split_text(piece, new_separators))
+
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, separator))
+
+        return final_chunks
+
 class DocumentProcessor:
     """
     DocumentProcessor handles the ingestion of raw documents from disk, 
@@ -26,7 +143,7 @@ class DocumentProcessor:
         Initializes the processor with a recursive text splitter for chunking
         and Ollama embeddings (via a local Ollama server) for vector generation.
         """
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        self.text_splitter = LiteralSeparatorTextSplitter(
             chunk_size=1000,                  # Target max size of each chunk
             chunk_overlap=200,                # Amount of overlap between chunks
             separators=["\n\n", "\n", ". ", " ", ""]  # Order of splitting priority
@@ -35,8 +152,34 @@ class DocumentProcessor:
         # Embedding model via Ollama server (must be running locally)
         self.embeddings = OllamaEmbeddings(
             model="nomic-embed-text",
-            base_url="http://localhost:11434"
+            base_url="http://localhost:11434",
+            # Pooled keep-alive connections for the underlying httpx client
+            client_kwargs={
+                "limits": httpx.Limits(
+                    max_connections=8,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=OLLAMA_KEEPALIVE_SECONDS,
+                ),
+            },
+        )
+
+        # Persistent embedding cache so identical chunks are only embedded once
+        os.makedirs(EMBED_CACHE_DIR, exist_ok=True)
+        self.embed_cache = sqlite3.connect(
+            os.path.join(EMBED_CACHE_DIR, "embeddings.sqlite3"),
+            # Shared across Streamlit sessions' threads; every use of the
+            # connection must hold embed_cache_lock
+            check_same_thread=False
+        )
+        self.embed_cache_lock = threading.Lock()
+        self.embed_cache.execute("PRAGMA journal_mode=WAL")
+        self.embed_cache.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
         )
+        self.embed_cache.commit()
+
+        # FAISS GPU resources, created lazily when an index is moved to GPU
+        self.gpu_resources = None
 
     def load_documents(self, directory: str) -> List[Document]:
         """
@@ -49,30 +192,50 @@ class DocumentProcessor:
         Returns:
             List[Document]: A list of LangChain Document objects.
         """
-        # Configure supported loaders by file extension
-        loaders = {
-            ".pdf": DirectoryLoader(directory, glob="**/*.pdf", loader_cls=PyPDFLoader),
-            ".txt": DirectoryLoader(directory, glob="**/*.txt", loader_cls=TextLoader),
-            ".md": DirectoryLoader(directory, glob="**/*.md", loader_cls=UnstructuredMarkdownLoader),
-        }
+        # Enumerate every supported file up front
+        all_files = []
+        for ext in LOADER_MAPPING:
+            all_files.extend(
+                glob.glob(os.path.join(directory, f"**/*{ext}"), recursive=True)
+            )
 
         documents = []
+        if not all_files:
+            return documents
+
+        max_workers = max(1, min(len(all_files), (os.cpu_count() or 2) - 1))
+        if max_workers == 1:
+            # A single file (or CPU) gains nothing from a pool; load inline
+            for file_path in all_files:
+                try:
+                    documents.extend(load_single_document(file_path))
+                except Exception as e:
+                    print(f"Error loading {file_path}: {str(e)}")
+
+            print(f"Loaded {len(documents)} documents from {len(all_files)} files")
+            return documents
 
-        # Try loading each supported file type
-        for file_type, loader in loaders.items():
-            try:
-                loaded = loader.load()
-                documents.extend(loaded)
-                print(f"Loaded {len(loaded)} {file_type} documents")
-            except Exception as e:
-                print(f"Error loading {file_type} documents: {str(e)}")
+        # Parse files in parallel; PDF text extraction is CPU-bound per file
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(load_single_document, file_path): file_path
+                for file_path in all_files
+            }
+            for future, file_path in futures.items():
+                try:
+                    documents.extend(future.result())
+                except Exception as e:
+                    print(f"Error loading {file_path}: {str(e)}")
 
+        print(f"Loaded {len(documents)} documents from {len(all_files)} files")
         return documents
 
     def process_documents(self, documents: List[Document]) -> List[Document]:
         """
         Splits each document into smaller overlapping chunks to improve embedding
-        quality and support better semantic retrieval.
+        quality and support better semantic retrieval. Splitting is pure-Python
+        CPU work, so large inputs (PARALLEL_SPLIT_MIN_CHARS and up) are sharded
+        across a process pool.
 
         Args:
             documents (List[Document]): Raw documents.
@@ -80,36 +243,380 @@ class DocumentProcessor:
         Returns:
             List[Document]: Chunked documents ready for embedding.
         """
-        return self.text_splitter.split_documents(documents)
+        total_chars = sum(len(doc.page_content) for doc in documents)
+        max_workers = max(1, min(len(documents), (os.cpu_count() or 2) - 1))
+        if max_workers == 1 or total_chars < PARALLEL_SPLIT_MIN_CHARS:
+            return self.text_splitter.split_documents(documents)
+
+        # Contiguous shards keep the chunks in document order after flattening
+        shard_size = -(-len(documents) // max_workers)  # Ceiling division
+        shards = [
+            documents[start:start + shard_size]
+            for start in range(0, len(documents), shard_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(self.text_splitter.split_documents, shards)
+            return [chunk for shard_chunks in results for chunk in shard_chunks]
+
+    def _cache_key(self, text: str) -> bytes:
+        """
+        Builds the embedding cache key for a chunk from its content and the
+        embedding model name.
+
+        Args:
+            text (str): Chunk content.
+
+        Returns:
+            bytes: 16-byte BLAKE2b digest.
+        """
+        return hashlib.blake2b(
+            f"{self.embeddings.model}:{text}".encode(), digest_size=16
+        ).digest()
+
+    def _cache_get(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """
+        Looks up cached embeddings in bulk.
+
+        Args:
+            keys (List[bytes]): Cache keys to look up.
+
+        Returns:
+            Dict[bytes, List[float]]: Vectors for the keys that were found.
+        """
+        found = {}
+        unique = list(set(keys))
+
+        for start in range(0, len(unique), CACHE_LOOKUP_CHUNK):
+            chunk = unique[start:start + CACHE_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with self.embed_cache_lock:
+                rows = self.embed_cache.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+        return found
+
+    def _cache_put(self, keys: List[bytes], vectors: List[List[float]]):
+        """
+        Stores embeddings in the cache as raw float32 bytes.
+
+        Args:
+            keys (List[bytes]): Cache keys.
+            vectors (List[List[float]]): Embedding vectors matching the keys.
+        """
+        rows = [(key, np.asarray(vector, dtype=np.float32).tobytes())
+                for key, vector in zip(keys, vectors)]
+        with self.embed_cache_lock:
+            self.embed_cache.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+            self.embed_cache.commit()
+
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeds texts in batches of EMBED_BATCH_SIZE so that each HTTP request
+        to the Ollama server carries many chunks instead of one. Identical
+        chunks are embedded once, texts are sorted by length so every batch
+        pads to a similar length, and chunks already present in the embedding
+        cache are not re-embedded.
+
+        Args:
+            texts (List[str]): Chunk contents to embed.
+
+        Returns:
+            List[List[float]]: One embedding vector per input text, in order.
+        """
+        # Deduplicate; index_map points each input text at its unique entry
+        unique = {}
+        index_map = [unique.setdefault(text, len(unique)) for text in texts]
+        texts = list(unique)
+
+        keys = [self._cache_key(text) for text in texts]
+        cached = self._cache_get(keys)
+        vectors = [cached.get(key) for key in keys]
+
+        # Length-sorted ("smart") batching over cache misses only
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        order = sorted(misses, key=lambda i: len(texts[i]))
+        print(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+
+        batches = [
+            order[start:start + EMBED_BATCH_SIZE]
+            for start in range(0, len(order), EMBED_BATCH_SIZE)
+        ]
+        if batches:
+            asyncio.run(self._aembed_batches(texts, keys, batches, vectors))
+
+        # Scatter unique vectors back to every occurrence
+        return [vectors[i] for i in index_map]
 
-    def create_vector_store(self, documents: List[Document], persist_directory: str) -> FAISS:
+    async def _aembed_batches(
+        self,
+        texts: List[str],
+        keys: List[bytes],
+        batches: List[List[int]],
+        vectors: List[List[float]],
+    ):
         """
-        Creates or loads a FAISS vector store using the chunked documents and
-        associated embeddings. Stores both the FAISS index and its metadata.
+        Posts batches to the Ollama embed endpoint concurrently, keeping up to
+        EMBED_CONCURRENCY requests in flight so network round-trips and JSON
+        (de)serialization overlap with server-side inference.
+
+        Args:
+            texts (List[str]): Chunk contents.
+            keys (List[bytes]): Cache keys matching texts.
+            batches (List[List[int]]): Batches of indices into texts to embed.
+            vectors (List[List[float]]): Output list, filled in place by index.
+        """
+        url = f"{self.embeddings.base_url}/api/embed"
+        semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+        async with aiohttp.ClientSession() as session:
+
+            async def embed_batch(batch: List[int]):
+                payload = {
+                    "model": self.embeddings.model,
+                    "input": [texts[i] for i in batch],
+                }
+                async with semaphore:
+                    async with session.post(url, json=payload) as response:
+                        response.raise_for_status()
+                        embedded = (await response.json())["embeddings"]
+
+                self._cache_put([keys[i] for i in batch], embedded)
+
+                # Scatter vectors back to the original chunk order
+                for i, vector in zip(batch, embedded):
+                    vectors[i] = vector
+
+            await asyncio.gather(*(embed_batch(batch) for batch in batches))
+
+    def create_vector_store(self, documents: List[Document], persist_directory: str) -> VectorStore:
+        """
+        Creates or loads a vector store using the chunked documents and
+        associated embeddings. Small knowledge bases are kept as a flat
+        embedding matrix; larger ones use a FAISS index. Stores both the
+        vectors and their metadata.
 
         Args:
             documents (List[Document]): Pre-processed document chunks.
-            persist_directory (str): Where to save/load the FAISS index and metadata.
+            persist_directory (str): Where to save/load the vectors and metadata.
 
         Returns:
-            FAISS: Vector store that can be used for semantic search.
+            VectorStore: Vector store that can be used for semantic search.
         """
+        matrix_path = os.path.join(persist_directory, "matrix.npy")
         index_path = os.path.join(persist_directory, "index.faiss")
+        meta_path = os.path.join(persist_directory, "meta.msgpack")
 
-        if os.path.exists(index_path):
-            # Load previously saved vector store
+        if os.path.exists(matrix_path):
+            # Load previously saved flat embedding matrix
+            print(f"Loading existing flat matrix store from {persist_directory}")
+            return FlatMatrixStore.load_local(persist_directory, self.embeddings)
+        elif os.path.exists(meta_path):
+            # Load previously saved FAISS index and its msgpack metadata
+            print(f"Loading existing FAISS vector store from {persist_directory}")
+            vector_store = self._load_faiss_store(persist_directory)
+            return self._move_to_gpu(vector_store)
+        elif os.path.exists(index_path):
+            # Load vector store saved with the legacy pickled docstore
             print(f"Loading existing FAISS vector store from {persist_directory}")
-            return FAISS.load_local(
+            vector_store = FAISS.load_local(
                 persist_directory, 
                 self.embeddings, 
                 allow_dangerous_deserialization=True  # Required to unpickle safely
             )
+            return self._move_to_gpu(vector_store)
         else:
-            # Create new vector store from documents
-            print(f"Creating new FAISS vector store in {persist_directory}")
             os.makedirs(persist_directory, exist_ok=True)
 
-            vector_store = FAISS.from_documents(documents, embedding=self.embeddings)
-            vector_store.save_local(persist_directory)  # Persist index to disk
+            texts = [d.page_content for d in documents]
+            metas = [d.metadata for d in documents]
+
+            # Embed explicitly in batches, then build the store from the vectors
+            vectors = self._embed_texts(texts)
+
+            if len(documents) <= FLAT_MATRIX_MAX_CHUNKS:
+                print(f"Creating new flat matrix store in {persist_directory}")
+                vector_store = FlatMatrixStore.from_embeddings(
+                    list(zip(texts, vectors)), self.embeddings, metadatas=metas
+                )
+                vector_store.save_local(persist_directory)
+                return vector_store
+
+            print(f"Creating new FAISS vector store in {persist_directory}")
+            vector_store = self._build_faiss_store(texts, vectors, metas)
+            self._save_faiss_store(vector_store, persist_directory)  # Persist CPU index
+
+            return self._move_to_gpu(vector_store)
+
+    def _build_faiss_store(
+        self, texts: List[str], vectors: List[List[float]], metas: List[dict]
+    ) -> FAISS:
+        """
+        Builds a FAISS vector store with an inner-product index over vectors
+        L2-normalized once in bulk, so search scores are cosine similarities.
+        The index is sized to the corpus: a flat index keeping vectors as
+        float16 (halving the memory read by every memory-bound search), or an
+        IVF-PQ index once the corpus reaches IVF_MIN_CHUNKS.
+
+        Args:
+            texts (List[str]): Chunk contents.
+            vectors (List[List[float]]): Embeddings matching texts.
+            metas (List[dict]): Metadata matching texts.
+
+        Returns:
+            FAISS: Vector store backed by a CPU index.
+        """
+        xb = np.array(vectors, dtype=np.float32)
+        faiss.normalize_L2(xb)
+        d = xb.shape[1]
+
+        if len(xb) >= IVF_MIN_CHUNKS:
+            print(f"Training IVF{IVF_NLIST},PQ{PQ_M} index (nprobe={IVF_NPROBE})")
+            index = faiss.index_factory(
+                d, f"IVF{IVF_NLIST},PQ{PQ_M}", faiss.METRIC_INNER_PRODUCT
+            )
+
+            # Train the coarse quantizer and PQ codebooks on a sample
+            rng = np.random.default_rng(0)
+            sample_size = min(len(xb), IVF_NLIST * 256)
+            index.train(xb[rng.choice(len(xb), sample_size, replace=False)])
+            faiss.extract_index_ivf(index).nprobe = IVF_NPROBE
+        else:
+            index = faiss.IndexScalarQuantizer(
+                d, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+            )
+
+        # Add the normalized matrix directly rather than letting the wrapper
+        # normalize it a second time
+        index.add(xb)
+
+        ids = [str(uuid.uuid4()) for _ in texts]
+        docstore = InMemoryDocstore({
+            doc_id: Document(id=doc_id, page_content=text, metadata=meta)
+            for doc_id, text, meta in zip(ids, texts, metas)
+        })
+
+        return self._wrap_faiss_index(index, docstore, dict(enumerate(ids)))
+
+    def _wrap_faiss_index(
+        self, index, docstore: InMemoryDocstore, index_to_docstore_id: Dict[int, str]
+    ) -> FAISS:
+        """
+        Wraps a raw FAISS index and its documents in a LangChain FAISS store.
+
+        Args:
+            index (faiss.Index): CPU index whose row i holds index_to_docstore_id[i].
+            docstore (InMemoryDocstore): Documents keyed by id.
+            index_to_docstore_id (Dict[int, str]): Index row to document id.
+
+        Returns:
+            FAISS: Vector store for the index.
+        """
+        # Inner-product indices hold normalized vectors; queries get normalized too
+        if index.metric_type == faiss.METRIC_INNER_PRODUCT:
+            # LangChain warns that normalize_L2 does not apply to inner product,
+            # but the flag still normalizes queries, which cosine scoring needs
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore", message="Normalizing L2 is not applicable", category=UserWarning
+                )
+                return FAISS(
+                    embedding_function=self.embeddings,
+                    index=index,
+                    docstore=docstore,
+                    index_to_docstore_id=index_to_docstore_id,
+                    normalize_L2=True,
+                    distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+                )
+
+        return FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
+        )
+
+    def _save_faiss_store(self, vector_store: FAISS, persist_directory: str):
+        """
+        Persists a FAISS vector store as a raw index file plus a msgpack list
+        of documents, avoiding the pickled docstore written by save_local.
+
+        Args:
+            vector_store (FAISS): Vector store backed by a CPU index.
+            persist_directory (str): Directory to write index.faiss and meta.msgpack to.
+        """
+        faiss.write_index(
+            vector_store.index, os.path.join(persist_directory, "index.faiss")
+        )
+
+        documents = [
+            vector_store.docstore.search(vector_store.index_to_docstore_id[i])
+            for i in range(vector_store.index.ntotal)
+        ]
+        # Flat-code and IVF indices need different mmap flags when loaded
+        index_kind = "ivf" if isinstance(vector_store.index, faiss.IndexIVF) else "flat"
+        write_document_meta(persist_directory, documents, index_kind=index_kind)
+
+    def _load_faiss_store(self, persist_directory: str) -> FAISS:
+        """
+        Loads a FAISS vector store written by _save_faiss_store. IVF inverted
+        lists (IO_FLAG_MMAP) and flat codes (IO_FLAG_MMAP_IFC) are
+        memory-mapped, so the OS pages in only the parts that are touched.
+
+        Args:
+            persist_directory (str): Directory containing index.faiss and meta.msgpack.
+
+        Returns:
+            FAISS: Vector store backed by a CPU index.
+        """
+        documents, fields = read_document_meta(persist_directory)
+
+        # The two flags cannot be combined: IO_FLAG_MMAP_IFC breaks IVF loading
+        io_flags = faiss.IO_FLAG_MMAP if fields["index_kind"] == "ivf" else faiss.IO_FLAG_MMAP_IFC
+        index = faiss.read_index(
+            os.path.join(persist_directory, "index.faiss"), io_flags
+        )
+
+        docstore = InMemoryDocstore({doc.id: doc for doc in documents})
+        index_to_docstore_id = {i: doc.id for i, doc in enumerate(documents)}
+
+        return self._wrap_faiss_index(index, docstore, index_to_docstore_id)
+
+    def _move_to_gpu(self, vector_store: FAISS) -> FAISS:
+        """
+        Swaps the store's FAISS index for a GPU copy when a GPU is available,
+        so similarity search runs as batched GEMM on the device. Requires a
+        GPU build of faiss (the pinned faiss_cpu always reports 0 GPUs).
+        Persisting must happen before this (or via faiss.index_gpu_to_cpu).
+
+        Args:
+            vector_store (FAISS): Vector store backed by a CPU index.
+
+        Returns:
+            FAISS: The same vector store, GPU-backed if possible.
+        """
+        if faiss.get_num_gpus() > 0:
+            print("Moving FAISS index to GPU")
+            # Resources must outlive the GPU index, so keep them on the processor
+            if self.gpu_resources is None:
+                self.gpu_resources = faiss.StandardGpuResources()
+
+            index = vector_store.index
+            if isinstance(index, faiss.IndexScalarQuantizer):
+                # GPU flat indices take fp16 via cloner options, not SQ codes
+                flat = faiss.IndexFlat(index.d, index.metric_type)
+                flat.add(index.reconstruct_n(0, index.ntotal))
+                index = flat
+
+            options = faiss.GpuClonerOptions()
+            options.useFloat16 = True  # Store vectors and run GEMM in fp16
+            vector_store.index = faiss.index_cpu_to_gpu(
+                self.gpu_resources, 0, index, options
+            )
 
-            return vector_store
+        return vector_store
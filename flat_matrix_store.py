@@ -0,0 +1,169 @@
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+import os
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+import faiss  # Facebook AI Similarity Search library
+
+from document_meta import read_document_meta, write_document_meta
+
+class FlatMatrixStore(VectorStore):
+    """
+    FlatMatrixStore is a lightweight vector store for small knowledge bases.
+    It keeps every embedding in a single contiguous (N, d) float32 matrix and
+    answers queries with one brute-force faiss.knn call, skipping index
+    construction and the per-query overhead of the FAISS wrapper.
+    """
+
+    def __init__(self, embedding: Embeddings, xb: np.ndarray, documents: List[Document]):
+        """
+        Wraps an already L2-normalized embedding matrix and its documents.
+
+        Args:
+            embedding (Embeddings): Model used to embed queries.
+            xb (np.ndarray): (N, d) matrix of L2-normalized document embeddings.
+            documents (List[Document]): Documents matching the rows of xb.
+        """
+        self.embedding = embedding
+        self.xb = np.ascontiguousarray(xb, dtype=np.float32)
+        self.documents = documents
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    @classmethod
+    def from_embeddings(
+        cls,
+        text_embeddings: Iterable[Tuple[str, List[float]]],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> "FlatMatrixStore":
+        """
+        Builds the store from precomputed embeddings, normalizing them once so
+        inner product equals cosine similarity at query time.
+
+        Args:
+            text_embeddings (Iterable[Tuple[str, List[float]]]): (text, vector) pairs.
+            embedding (Embeddings): Model used to embed queries.
+            metadatas (List[dict], optional): Metadata for each text.
+
+        Returns:
+            FlatMatrixStore: Store ready for similarity search.
+        """
+        text_embeddings = list(text_embeddings)
+        metadatas = metadatas or [{} for _ in text_embeddings]
+
+        documents = [
+            Document(page_content=text, metadata=metadata)
+            for (text, _), metadata in zip(text_embeddings, metadatas)
+        ]
+        xb = np.array([vector for _, vector in text_embeddings], dtype=np.float32)
+        faiss.normalize_L2(xb)  # In place, once for the whole matrix
+
+        return cls(embedding, xb, documents)
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: List[str],
+        embedding: Embeddings,
+        metadatas: Optional[List[dict]] = None,
+        **kwargs: Any,
+    ) -> "FlatMatrixStore":
+        """
+        Embeds texts and builds the store from them.
+
+        Args:
+            texts (List[str]): Texts to index.
+            embedding (Embeddings): Model used to embed texts and queries.
+            metadatas (List[dict], optional): Metadata for each text.
+
+        Returns:
+            FlatMatrixStore: Store ready for similarity search.
+        """
+        vectors = embedding.embed_documents(texts)
+        return cls.from_embeddings(zip(texts, vectors), embedding, metadatas=metadatas)
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """
+        Returns the k documents whose embeddings have the highest cosine
+        similarity with the given query vector.
+
+        Args:
+            embedding (List[float]): Query embedding.
+            k (int): Number of documents to return.
+
+        Returns:
+            List[Tuple[Document, float]]: Documents with their similarity scores.
+        """
+        k = min(k, len(self.documents))
+        if k == 0:
+            return []
+
+        xq = np.array([embedding], dtype=np.float32)
+        faiss.normalize_L2(xq)
+        scores, indices = faiss.knn(xq, self.xb, k, metric=faiss.METRIC_INNER_PRODUCT)
+
+        return [
+            (self.documents[i], float(score))
+            for score, i in zip(scores[0], indices[0])
+        ]
+
+    def similarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        embedding = self.embedding.embed_query(query)
+        return self.similarity_search_with_score_by_vector(embedding, k, **kwargs)
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4, **kwargs: Any
+    ) -> List[Document]:
+        results = self.similarity_search_with_score_by_vector(embedding, k, **kwargs)
+        return [doc for doc, _ in results]
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> List[Document]:
+        results = self.similarity_search_with_score(query, k, **kwargs)
+        return [doc for doc, _ in results]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are inner products of normalized vectors (cosine similarity)
+        return self._max_inner_product_relevance_score_fn
+
+    def save_local(self, folder_path: str):
+        """
+        Saves the float32 embedding matrix with np.save and the documents
+        alongside it. The matrix is kept float32 so it can be memory-mapped
+        and searched by faiss.knn as-is on load.
+
+        Args:
+            folder_path (str): Directory to write matrix.npy and meta.msgpack to.
+        """
+        os.makedirs(folder_path, exist_ok=True)
+        np.save(os.path.join(folder_path, "matrix.npy"), self.xb)
+        write_document_meta(folder_path, self.documents)
+
+    @classmethod
+    def load_local(cls, folder_path: str, embedding: Embeddings) -> "FlatMatrixStore":
+        """
+        Loads a store previously written with save_local. The matrix is
+        memory-mapped, so the OS pages it in on first search instead of
+        reading it all up front.
+
+        Args:
+            folder_path (str): Directory containing matrix.npy and meta.msgpack.
+            embedding (Embeddings): Model used to embed queries.
+
+        Returns:
+            FlatMatrixStore: The loaded store.
+        """
+        # Copy-on-write mapping: no copy is made, but the array stays writeable
+        xb = np.load(os.path.join(folder_path, "matrix.npy"), mmap_mode="c")
+        documents, _ = read_document_meta(folder_path)
+
+        return cls(embedding, xb, documents)
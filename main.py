@@ -3,6 +3,7 @@ from document_processor import DocumentProcessor           # Custom module to ha
 from voice_assistant_rag import VoiceAssistantRAG         # Custom module implementing the voice-enabled RAG system
 import streamlit as st                                    # UI framework for web app
 import tempfile                                            # To create temporary directories for uploaded files
+import shutil                                              # To stream uploads to disk and remove temp directories
 import os                                                  # For file and environment operations
 from dotenv import load_dotenv                             # To load environment variables from .env file
 
@@ -10,6 +11,15 @@ from dotenv import load_dotenv                             # To load environment
 os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
 
 
+@st.cache_resource
+def get_doc_processor():
+    """
+    Creates the DocumentProcessor once per Streamlit process so its embeddings
+    client and text splitter are reused across reruns.
+    """
+    return DocumentProcessor()
+
+
 def setup_knowledge_base():
     """
     Handles document upload, processing, and vector store creation.
@@ -18,7 +28,7 @@ def setup_knowledge_base():
     """
     st.title("Knowledge Base Setup")
 
-    doc_processor = DocumentProcessor()
+    doc_processor = get_doc_processor()
 
     # Upload documents in supported formats
     uploaded_files = st.file_uploader(
@@ -34,7 +44,7 @@ def setup_knowledge_base():
             for file in uploaded_files:
                 file_path = os.path.join(temp_dir, file.name)
                 with open(file_path, "wb") as f:
-                    f.write(file.getbuffer())
+                    shutil.copyfileobj(file, f, length=1 << 20)  # Copy in 1 MiB blocks
 
             try:
                 # Load and preprocess documents
@@ -56,9 +66,7 @@ def setup_knowledge_base():
 
             finally:
                 # Clean up temporary directory and files
-                for file in os.listdir(temp_dir):
-                    os.remove(os.path.join(temp_dir, file))
-                os.rmdir(temp_dir)
+                shutil.rmtree(temp_dir, ignore_errors=True)
 
     return None
 
@@ -155,8 +163,7 @@ def main():
                         response, selected_voice
                     )
                     if audio_file:
-                        st.audio(audio_file)
-                        os.unlink(audio_file)  # Clean up temp audio file
+                        st.audio(audio_file)  # File is kept in the TTS cache
                     else:
                         st.error("Failed to generate voice response")
 
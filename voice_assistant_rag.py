@@ -1,14 +1,42 @@
 from voice_generator import VoiceGenerator
-import tempfile
-import os
-import soundfile as sf
-import sounddevice as sd
-import whisper
-
-from langchain.memory import ConversationBufferMemory
-from langchain.chains import ConversationalRetrievalChain
+import numpy as np
+import streamlit as st
+
 from langchain_ollama import ChatOllama, OllamaEmbeddings
 
+# Heavy audio/model/chain imports are deferred to where they are used so that
+# importing this module (e.g. from the "Setup Knowledge Base" page) stays cheap.
+
+@st.cache_resource
+def get_whisper():
+    """
+    Loads the Whisper speech-to-text model once per Streamlit process.
+    Uses faster-whisper (CTranslate2) with int8 weights, on GPU if available.
+
+    Returns:
+        WhisperModel: Shared transcription model.
+    """
+    import ctranslate2
+    from faster_whisper import WhisperModel
+
+    if ctranslate2.get_cuda_device_count() > 0:
+        return WhisperModel("base", device="cuda", compute_type="int8_float16")
+    return WhisperModel("base", device="cpu", compute_type="int8")
+
+@st.cache_resource
+def get_voice_generator(elevenlabs_api_key):
+    """
+    Creates the ElevenLabs voice generator once per API key so its HTTP
+    client and connection pool are reused across Streamlit reruns.
+
+    Args:
+        elevenlabs_api_key (str): API key for ElevenLabs voice synthesis.
+
+    Returns:
+        VoiceGenerator: Shared TTS generator.
+    """
+    return VoiceGenerator(elevenlabs_api_key)
+
 class VoiceAssistantRAG:
     """
     VoiceAssistantRAG is a voice-enabled Retrieval-Augmented Generation (RAG) system.
@@ -23,7 +51,7 @@ class VoiceAssistantRAG:
         Args:
             elevenlabs_api_key (str): API key for ElevenLabs voice synthesis.
         """
-        self.whisper_model = whisper.load_model("base")  # Load Whisper model for speech-to-text
+        self.whisper_model = get_whisper()  # Cached Whisper model for speech-to-text
         self.llm = ChatOllama(model="llama3.2", temperature=0)  # Local LLM via Ollama
         self.embeddings = OllamaEmbeddings(
             model="nomic-embed-text",
@@ -32,8 +60,8 @@ class VoiceAssistantRAG:
 
         self.vector_store = None       # Will hold the FAISS vector store
         self.qa_chain = None           # Conversational QA chain
-        self.sample_rate = 44100       # Audio recording sample rate (Hz)
-        self.voice_generator = VoiceGenerator(elevenlabs_api_key)  # TTS generator
+        self.sample_rate = 16000       # Record at Whisper's native rate (Hz)
+        self.voice_generator = get_voice_generator(elevenlabs_api_key)  # Cached TTS generator
 
     def setup_vector_store(self, vector_store):
         """
@@ -42,6 +70,9 @@ class VoiceAssistantRAG:
         Args:
             vector_store: A FAISS vector store loaded with processed documents.
         """
+        from langchain.memory import ConversationBufferMemory
+        from langchain.chains import ConversationalRetrievalChain
+
         self.vector_store = vector_store
 
         memory = ConversationBufferMemory(
@@ -64,12 +95,15 @@ class VoiceAssistantRAG:
             duration (int): Duration of the recording in seconds.
 
         Returns:
-            numpy.ndarray: Recorded audio samples.
+            numpy.ndarray: Recorded 16-bit PCM audio samples.
         """
+        import sounddevice as sd
+
         recording = sd.rec(
             int(duration * self.sample_rate),
             samplerate=self.sample_rate,
-            channels=1
+            channels=1,
+            dtype="int16"  # Native mic precision, half the bytes of float32
         )
         sd.wait()  # Wait until recording is finished
         return recording
@@ -79,27 +113,15 @@ class VoiceAssistantRAG:
         Transcribes recorded audio to text using Whisper.
 
         Args:
-            audio_array: Numpy array of audio samples.
+            audio_array: Numpy array of 16 kHz mono int16 audio samples.
 
         Returns:
             str: Transcribed text.
         """
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-            temp_path = temp_audio.name  # Store file path
-
-        # Write audio data to temporary WAV file
-        sf.write(temp_path, audio_array, self.sample_rate)
-
-        try:
-            result = self.whisper_model.transcribe(temp_path)
-        finally:
-            # Clean up temporary file
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                print(f"Warning: Failed to delete temp audio file: {e}")
-
-        return result["text"]
+        # Whisper takes 16 kHz mono float32 in [-1, 1] directly; no WAV roundtrip needed
+        audio = audio_array.squeeze().astype(np.float32) / 32768.0
+        segments, _ = self.whisper_model.transcribe(audio)
+        return "".join(segment.text for segment in segments)
 
     def generate_response(self, query):
         """
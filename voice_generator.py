@@ -1,6 +1,14 @@
+import hashlib
+import os
 import tempfile
 from elevenlabs.client import ElevenLabs
 
+# Directory of synthesized responses, keyed by hash of (voice_id, text)
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "tts_cache")
+
+# Size cap for the TTS cache; least recently used files are evicted above it
+TTS_CACHE_MAX_MB = float(os.getenv("TTS_CACHE_MAX_MB", "100"))
+
 class VoiceGenerator:
     """
     A class to generate speech audio from text using the ElevenLabs API.
@@ -30,14 +38,16 @@ class VoiceGenerator:
 
     def generate_voice_response(self, text: str, voice_name: str = None) -> str:
         """
-        Converts the given text into speech using a selected voice and saves it to a temporary MP3 file.
+        Converts the given text into speech using a selected voice and saves it to an MP3 file
+        in the TTS cache. Identical (voice, text) pairs are served from the cache without
+        calling the API again.
         
         Args:
             text (str): The text to be converted into speech.
             voice_name (str, optional): The name of the voice to use. Defaults to None (uses default voice).
         
         Returns:
-            str: Path to the generated temporary MP3 file, or None if generation fails.
+            str: Path to the cached MP3 file, or None if generation fails.
         """
         try:
             # Use provided voice or fall back to default
@@ -48,22 +58,71 @@ class VoiceGenerator:
             if not voice_id:
                 raise ValueError(f"Voice '{selected_voice}' not found in voice map.")
 
-            # Generate audio as a byte-stream generator from ElevenLabs API
-            audio_generator = self.client.text_to_speech.convert(
+            # Serve previously synthesized audio straight from the cache
+            key = hashlib.sha1(f"{voice_id}:{text}".encode()).hexdigest()
+            cache_path = os.path.join(TTS_CACHE_DIR, f"{key}.mp3")
+            if os.path.exists(cache_path):
+                os.utime(cache_path)  # Mark as recently used for eviction
+                return cache_path
+
+            # Stream audio chunks from the ElevenLabs API as they are synthesized
+            audio_stream = self.client.text_to_speech.stream(
                 voice_id=voice_id,
                 model_id="eleven_multilingual_v2",
                 text=text
             )
 
-            # Concatenate all audio chunks into a single byte array
-            audio_bytes = b"".join(audio_generator)
+            # Write each chunk to a temporary .mp3 file as it arrives, then move it into
+            # the cache so a failed synthesis never leaves a partial cache entry
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                suffix=".mp3", dir=TTS_CACHE_DIR, delete=False
+            ) as temp_audio:
+                try:
+                    for chunk in audio_stream:
+                        temp_audio.write(chunk)
+                except Exception:
+                    temp_audio.close()
+                    os.remove(temp_audio.name)
+                    raise
 
-            # Write the audio bytes to a temporary .mp3 file and return the path
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_audio:
-                temp_audio.write(audio_bytes)
-                return temp_audio.name
+            os.replace(temp_audio.name, cache_path)
+            self.evict_cache(keep_path=cache_path)
+            return cache_path
 
         except Exception as e:
             # Log and return None on error
             print(f"Error generating voice response: {e}")
             return None
+
+    def evict_cache(self, keep_path: str = None):
+        """
+        Deletes the least recently used MP3 files from the TTS cache until it
+        fits within TTS_CACHE_MAX_MB. Most responses are unique, so without
+        this the cache would grow without bound.
+
+        Args:
+            keep_path (str, optional): File that must not be evicted (e.g. the one just written).
+        """
+        entries = []
+        for name in os.listdir(TTS_CACHE_DIR):
+            path = os.path.join(TTS_CACHE_DIR, name)
+            # Skip in-progress downloads (tempfile's "tmp" prefix never occurs in hex keys)
+            if name.endswith(".mp3") and not name.startswith("tmp") and path != keep_path:
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        if keep_path:
+            total_bytes += os.path.getsize(keep_path)
+
+        # Oldest first by modification time (refreshed on every cache hit)
+        max_bytes = TTS_CACHE_MAX_MB * 1024 * 1024
+        for _, size, path in sorted(entries):
+            if total_bytes <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError as e:
+                print(f"Warning: Failed to evict cached audio file: {e}")